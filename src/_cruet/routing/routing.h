@@ -61,6 +61,7 @@ typedef struct {
     char *endpoint;
     uint16_t methods_bitmask;  /* standard methods as bits */
     PyObject *methods_extra;   /* frozenset of non-standard methods, or NULL */
+    PyObject *methods_cache;   /* frozenset built on first .methods access */
     int strict_slashes;
     RuleSegment *segments;
     int n_segments;
@@ -215,7 +215,8 @@ Rule_init(Cruet_Rule *self, PyObject *args, PyObject *kwargs)
 
     /* Parse methods into bitmask + extras */
     self->methods_bitmask = 0;
-    self->methods_extra = NULL;
+    Py_CLEAR(self->methods_extra);
+    Py_CLEAR(self->methods_cache);
     PyObject *extras_list = NULL; /* temporary list for non-standard methods */
 
     if (methods && methods != Py_None) {
@@ -286,6 +287,7 @@ Rule_dealloc(Cruet_Rule *self)
     free(self->rule_str);
     free(self->endpoint);
     Py_XDECREF(self->methods_extra);
+    Py_XDECREF(self->methods_cache);
     if (self->segments) {
         for (int i = 0; i < self->n_segments; i++)
             free_segment(&self->segments[i]);
@@ -308,10 +310,16 @@ Rule_get_endpoint(Cruet_Rule *self, void *closure)
     Py_RETURN_NONE;
 }
 
-/* Reconstruct frozenset from bitmask + extras (only called from Python, not hot path) */
+/* Reconstruct frozenset from bitmask + extras. Methods are immutable after
+ * init, so the result is built once and shared by every later access. */
 static PyObject *
 Rule_get_methods(Cruet_Rule *self, void *closure)
 {
+    if (self->methods_cache) {
+        Py_INCREF(self->methods_cache);
+        return self->methods_cache;
+    }
+
     PyObject *method_set = PySet_New(NULL);
     if (!method_set) return NULL;
 
@@ -350,6 +358,10 @@ Rule_get_methods(Cruet_Rule *self, void *closure)
 
     PyObject *result = PyFrozenSet_New(method_set);
     Py_DECREF(method_set);
+    if (!result) return NULL;
+
+    Py_INCREF(result);
+    self->methods_cache = result;
     return result;
 }
 
@@ -10,26 +10,98 @@
  * Returns None if the input is incomplete/malformed.
  */
 
-/* Find \r\n in buffer */
+/* Find \r\n in buffer.  memchr does the scan for '\r' (vectorized in
+ * glibc and the BSD/macOS libcs), then only candidates are checked. */
 static const char *
 find_crlf(const char *buf, size_t len)
 {
-    for (size_t i = 0; i + 1 < len; i++) {
-        if (buf[i] == '\r' && buf[i + 1] == '\n')
-            return buf + i;
+    const char *end = buf + len;
+    const char *p = buf;
+    while (p + 1 < end) {
+        p = memchr(p, '\r', (size_t)(end - p - 1));
+        if (!p)
+            return NULL;
+        if (p[1] == '\n')
+            return p;
+        p++;
     }
     return NULL;
 }
 
-PyObject *
-cruet_parse_http_request(PyObject *self, PyObject *args)
+/* Interned strings for the standard methods, filled by
+ * cruet_http_parser_init() so the hot path never decodes them. */
+enum {
+    M_GET, M_POST, M_PUT, M_DELETE, M_HEAD, M_OPTIONS, M_PATCH, M_TRACE,
+    M_CONNECT, M_COUNT
+};
+
+static const char *const method_names[M_COUNT] = {
+    "GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH", "TRACE",
+    "CONNECT",
+};
+
+static PyObject *method_strs[M_COUNT];
+
+int
+cruet_http_parser_init(void)
 {
-    const char *data;
-    Py_ssize_t data_len;
+    for (int i = 0; i < M_COUNT; i++) {
+        method_strs[i] = PyUnicode_InternFromString(method_names[i]);
+        if (!method_strs[i])
+            return -1;
+    }
+    return 0;
+}
 
-    if (!PyArg_ParseTuple(args, "y#", &data, &data_len))
-        return NULL;
+#define METHOD_IS(s, len, lit) \
+    ((len) == sizeof(lit) - 1 && memcmp((s), (lit), sizeof(lit) - 1) == 0)
 
+/* Return a new reference to the method string.  Dispatches on the first
+ * byte so GET/POST resolve with one compare; rare and non-standard
+ * methods fall through to a fresh decode. */
+static PyObject *
+decode_method(const char *s, size_t len)
+{
+    int idx = -1;
+
+    switch (s[0]) {
+    case 'G':
+        if (METHOD_IS(s, len, "GET")) idx = M_GET;
+        break;
+    case 'P':
+        if (METHOD_IS(s, len, "POST")) idx = M_POST;
+        else if (METHOD_IS(s, len, "PUT")) idx = M_PUT;
+        else if (METHOD_IS(s, len, "PATCH")) idx = M_PATCH;
+        break;
+    case 'H':
+        if (METHOD_IS(s, len, "HEAD")) idx = M_HEAD;
+        break;
+    case 'D':
+        if (METHOD_IS(s, len, "DELETE")) idx = M_DELETE;
+        break;
+    case 'O':
+        if (METHOD_IS(s, len, "OPTIONS")) idx = M_OPTIONS;
+        break;
+    case 'T':
+        if (METHOD_IS(s, len, "TRACE")) idx = M_TRACE;
+        break;
+    case 'C':
+        if (METHOD_IS(s, len, "CONNECT")) idx = M_CONNECT;
+        break;
+    }
+
+    if (idx >= 0 && method_strs[idx]) {
+        Py_INCREF(method_strs[idx]);
+        return method_strs[idx];
+    }
+    return PyUnicode_DecodeLatin1(s, len, NULL);
+}
+
+#undef METHOD_IS
+
+PyObject *
+cruet_parse_http_bytes(const char *data, Py_ssize_t data_len)
+{
     if (data_len == 0)
         Py_RETURN_NONE;
 
@@ -81,7 +153,7 @@ cruet_parse_http_request(PyObject *self, PyObject *args)
     PyObject *result = PyDict_New();
     if (!result) return NULL;
 
-    PyObject *method = PyUnicode_DecodeLatin1(method_start, method_len, NULL);
+    PyObject *method = decode_method(method_start, method_len);
     PyObject *path = PyUnicode_DecodeLatin1(uri_start, path_len, NULL);
     PyObject *version = PyUnicode_DecodeLatin1(version_start, version_len, NULL);
     PyObject *qs = query_start
@@ -104,6 +176,7 @@ cruet_parse_http_request(PyObject *self, PyObject *args)
     const char *hp = line_end + 2; /* skip \r\n after request line */
     int keep_alive = 1; /* default for HTTP/1.1 */
     long content_length = -1;
+    long content_length_count = 0;
 
     while (hp < data + data_len) {
         /* Find end of this header line */
@@ -139,6 +212,7 @@ cruet_parse_http_request(PyObject *self, PyObject *args)
         /* Check for Content-Length */
         if (hname_len == 14 && strncasecmp(hp, "Content-Length", 14) == 0) {
             char tmp[32];
+            content_length_count++;
             if (hval_len < sizeof(tmp)) {
                 memcpy(tmp, hval, hval_len);
                 tmp[hval_len] = '\0';
@@ -174,6 +248,12 @@ cruet_parse_http_request(PyObject *self, PyObject *args)
     PyDict_SetItemString(result, "body", body);
     Py_DECREF(body);
 
+    /* Number of Content-Length lines; the headers dict merges repeats */
+    PyObject *cl_count = PyLong_FromLong(content_length_count);
+    if (!cl_count) { Py_DECREF(result); return NULL; }
+    PyDict_SetItemString(result, "content_length_count", cl_count);
+    Py_DECREF(cl_count);
+
     /* Keep-alive flag */
     PyObject *ka = keep_alive ? Py_True : Py_False;
     Py_INCREF(ka);
@@ -182,3 +262,54 @@ cruet_parse_http_request(PyObject *self, PyObject *args)
 
     return result;
 }
+
+PyObject *
+cruet_parse_http_request(PyObject *self, PyObject *args)
+{
+    const char *data;
+    Py_ssize_t data_len;
+
+    if (!PyArg_ParseTuple(args, "y#", &data, &data_len))
+        return NULL;
+
+    return cruet_parse_http_bytes(data, data_len);
+}
+
+/*
+ * Parse a list of raw requests in one call.
+ * Returns a list of the same length holding a dict (or None) per item.
+ */
+PyObject *
+cruet_parse_http_requests_batch(PyObject *self, PyObject *seq)
+{
+    PyObject *items = PySequence_Fast(seq, "expected a sequence of bytes");
+    if (!items) return NULL;
+
+    Py_ssize_t n = PySequence_Fast_GET_SIZE(items);
+    PyObject **src = PySequence_Fast_ITEMS(items);
+    PyObject *results = PyList_New(n);
+    if (!results) { Py_DECREF(items); return NULL; }
+
+    for (Py_ssize_t i = 0; i < n; i++) {
+        PyObject *raw = src[i];
+        if (!PyBytes_Check(raw)) {
+            PyErr_Format(PyExc_TypeError,
+                         "item %zd: expected bytes, got %.200s",
+                         i, Py_TYPE(raw)->tp_name);
+            Py_DECREF(results);
+            Py_DECREF(items);
+            return NULL;
+        }
+        PyObject *parsed = cruet_parse_http_bytes(PyBytes_AS_STRING(raw),
+                                                  PyBytes_GET_SIZE(raw));
+        if (!parsed) {
+            Py_DECREF(results);
+            Py_DECREF(items);
+            return NULL;
+        }
+        PyList_SET_ITEM(results, i, parsed);
+    }
+
+    Py_DECREF(items);
+    return results;
+}
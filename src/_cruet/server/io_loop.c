@@ -178,24 +178,8 @@ read_cb(struct bufferevent *bev, void *ctx)
     /* Parse HTTP request — need the GIL */
     PyGILState_STATE gstate = PyGILState_Ensure();
 
-    PyObject *data_bytes = PyBytes_FromStringAndSize(
+    PyObject *parsed = cruet_parse_http_bytes(
         conn->read_buf.data, (Py_ssize_t)conn->read_buf.len);
-    if (!data_bytes) {
-        PyGILState_Release(gstate);
-        send_error_response(conn, 500, "Internal Server Error");
-        return;
-    }
-
-    PyObject *parse_args = PyTuple_Pack(1, data_bytes);
-    Py_DECREF(data_bytes);
-    if (!parse_args) {
-        PyGILState_Release(gstate);
-        send_error_response(conn, 500, "Internal Server Error");
-        return;
-    }
-
-    PyObject *parsed = cruet_parse_http_request(NULL, parse_args);
-    Py_DECREF(parse_args);
 
     if (!parsed) {
         /* Python exception in parser */
@@ -5,7 +5,10 @@
 #include <Python.h>
 
 /* HTTP parser: parse raw request bytes into a Python dict */
+int cruet_http_parser_init(void);
+PyObject *cruet_parse_http_bytes(const char *data, Py_ssize_t data_len);
 PyObject *cruet_parse_http_request(PyObject *self, PyObject *args);
+PyObject *cruet_parse_http_requests_batch(PyObject *self, PyObject *seq);
 
 /* WSGI helpers: environ construction and response formatting (wsgi.c) */
 PyObject *Cruet_build_environ(PyObject *parsed, PyObject *client_addr,
@@ -3,6 +3,8 @@
 static PyMethodDef server_functions[] = {
     {"parse_http_request", cruet_parse_http_request, METH_VARARGS,
      "Parse a raw HTTP/1.1 request into a dict."},
+    {"parse_http_requests_batch", cruet_parse_http_requests_batch, METH_O,
+     "Parse a list of raw HTTP/1.1 requests into a list of dicts."},
 #ifdef CRUET_HAS_LIBEVENT
     {"run_event_loop", (PyCFunction)cruet_run_event_loop,
      METH_VARARGS | METH_KEYWORDS,
@@ -28,6 +30,8 @@ register_methods(PyObject *module, PyMethodDef *methods)
 int
 Cruet_InitServer(PyObject *module)
 {
+    if (cruet_http_parser_init() < 0)
+        return -1;
     if (register_methods(module, server_functions) < 0)
         return -1;
     if (register_methods(module, cruet_wsgi_methods) < 0)
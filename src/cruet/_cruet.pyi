@@ -229,7 +229,20 @@ def parse_http_request(data: bytes) -> Optional[Dict[str, Any]]:
     """Parse raw HTTP request bytes.
 
     Returns a dict with keys: ``method``, ``path``, ``version``,
-    ``query_string``, ``headers``, ``body``, ``keep_alive``.
+    ``query_string``, ``headers``, ``body``, ``keep_alive`` and
+    ``content_length_count`` (how many Content-Length lines were seen,
+    since ``headers`` keeps only the last of a repeated name).
     Returns ``None`` if the request is incomplete or malformed.
     """
     ...
+
+
+def parse_http_requests_batch(
+    requests: Sequence[bytes],
+) -> List[Optional[Dict[str, Any]]]:
+    """Parse several raw HTTP requests in a single call.
+
+    Each item is parsed as by ``parse_http_request``; the result list
+    holds one dict (or ``None``) per input, in order.
+    """
+    ...
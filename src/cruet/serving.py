@@ -9,15 +9,52 @@ import time
 
 from cruet._cruet import parse_http_request, build_environ, format_response
 
+_BAD_REQUEST = b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n"
+
+
+def _content_length(parsed):
+    """Return the declared body length of the *parsed* request.
+
+    Returns 0 when no Content-Length is present and None when the value is
+    not a plain ASCII decimal number or the header is repeated.
+    """
+    if parsed.get("content_length_count", 0) > 1:
+        return None
+    values = [
+        value.strip() for name, value in parsed["headers"].items()
+        if name.lower() == "content-length"
+    ]
+    if not values:
+        return 0
+    value = values[0]
+    if not (value.isascii() and value.isdigit()):
+        return None
+    return int(value)
+
+
+def _has_transfer_encoding(headers):
+    """Return True if *headers* declare a Transfer-Encoding.
+
+    Chunked bodies are not decoded, so such requests are refused rather
+    than framed by a Content-Length the client may not honour.
+    """
+    return any(name.lower() == "transfer-encoding" for name in headers)
+
 
 class WSGIServer:
     """Simple WSGI server using cruet's C HTTP parser."""
 
-    def __init__(self, app, host="127.0.0.1", port=8000, backlog=128):
+    # Seconds a client may stay silent before it is disconnected
+    timeout = 30
+
+    def __init__(self, app, host="127.0.0.1", port=8000, backlog=128,
+                 timeout=None):
         self.app = app
         self.host = host
         self.port = port
         self.backlog = backlog
+        if timeout is not None:
+            self.timeout = timeout
         self._running = False
         self._sock = None
 
@@ -35,32 +72,70 @@ class WSGIServer:
         return sock
 
     def handle_request(self, client_sock, client_addr):
-        """Handle a single HTTP request on a connected socket."""
+        """Handle a single HTTP request on a connected socket.
+
+        Bytes sent after the request are discarded, so the caller must not
+        reuse the connection; use ``serve_connection`` for keep-alive.
+        """
+        client_sock.settimeout(self.timeout)
+        self._handle_one(client_sock, client_addr, b"")
+
+    def serve_connection(self, client_sock, client_addr):
+        """Serve requests on a connected socket until it is closed.
+
+        Pipelined requests already buffered are answered in order. A client
+        that sends nothing for ``timeout`` seconds is disconnected.
+
+        This blocks for the life of the connection, so it is meant for
+        callers that give each connection its own thread. ``serve_forever``
+        and ``run_worker`` still answer one request per connection.
+        """
+        client_sock.settimeout(self.timeout)
+        keep_open, pending = True, b""
+        while keep_open:
+            keep_open, pending = self._handle_one(
+                client_sock, client_addr, pending)
+
+    def _handle_one(self, client_sock, client_addr, data):
+        """Read, dispatch and answer one request.
+
+        *data* holds bytes already read from the connection. Returns
+        ``(keep_open, rest)`` where *rest* is whatever followed the request.
+        """
         try:
-            # Read request data
-            data = b""
+            # Read until the head and the whole declared body are buffered;
+            # only then is it safe to say where the next request starts.
+            parsed = None
+            head_end = data.find(b"\r\n\r\n")
             while True:
+                if head_end >= 0:
+                    if parsed is None:
+                        parsed = parse_http_request(data)
+                        length = (None if parsed is None
+                                  or _has_transfer_encoding(parsed["headers"])
+                                  else _content_length(parsed))
+                        if length is None:
+                            client_sock.sendall(_BAD_REQUEST)
+                            return False, b""
+                    if len(data) - (head_end + 4) >= length:
+                        break
                 try:
                     chunk = client_sock.recv(65536)
-                    if not chunk:
-                        return
-                    data += chunk
-                    # Check if we have a complete request
-                    if b"\r\n\r\n" in data:
-                        # Check Content-Length for body
-                        parsed = parse_http_request(data)
-                        if parsed is not None:
-                            break
-                except BlockingIOError:
-                    break
-
-            if not data:
-                return
-
-            parsed = parse_http_request(data)
-            if parsed is None:
-                client_sock.sendall(b"HTTP/1.1 400 Bad Request\r\nContent-Length: 0\r\n\r\n")
-                return
+                except (socket.timeout, BlockingIOError):
+                    chunk = b""
+                if not chunk:
+                    if parsed is not None:
+                        # The body can no longer be completed
+                        client_sock.sendall(_BAD_REQUEST)
+                    return False, b""
+                data += chunk
+                if head_end < 0:
+                    head_end = data.find(b"\r\n\r\n")
+
+            # Anything past the body belongs to the next pipelined request
+            body_end = head_end + 4 + length
+            parsed["body"] = data[head_end + 4:body_end]
+            rest = data[body_end:]
 
             # Build WSGI environ
             environ = build_environ(parsed, client_addr, (self.host, self.port))
@@ -86,6 +161,8 @@ class WSGIServer:
             # Handle keep-alive
             if not parsed.get("keep_alive", True):
                 client_sock.close()
+                return False, b""
+            return True, rest
 
         except Exception as e:
             try:
@@ -93,6 +170,7 @@ class WSGIServer:
                 client_sock.sendall(error_resp)
             except Exception:
                 pass
+            return False, b""
 
     def serve_forever(self):
         """Run the server event loop."""
@@ -56,6 +56,13 @@ class TestRuleCreation:
         for m in ["GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS"]:
             assert m in methods
 
+    def test_methods_cached_frozenset(self):
+        r = Rule("/resource", methods=["POST", "PURGE"])
+        methods = r.methods
+        assert isinstance(methods, frozenset)
+        assert methods == {"POST", "PURGE", "HEAD", "OPTIONS"}
+        assert r.methods is methods
+
     def test_strict_slashes_default(self):
         r = Rule("/hello")
         assert r.strict_slashes is True
@@ -0,0 +1,135 @@
+"""Shared fixtures for the server and parser tests."""
+import functools
+import selectors
+import socket
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from cruet import Cruet
+from cruet._cruet import parse_http_request
+from cruet.serving import WSGIServer
+
+
+def _make_app():
+    app = Cruet(__name__)
+
+    @app.route("/")
+    def index():
+        return "Hello from cruet!"
+
+    @app.route("/echo", methods=["POST"])
+    def echo():
+        from cruet.globals import request
+        return request.data.decode("utf-8", errors="replace")
+
+    @app.route("/json")
+    def json_view():
+        return {"status": "ok"}
+
+    return app
+
+
+def wait_for_port(port, timeout=5.0):
+    """Block until something accepts TCP connections on *port*."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=0.2).close()
+            return
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.005)
+
+
+# One receive buffer per socket, so keep-alive tests reuse it across calls
+# and concurrent clients on different sockets never share one.
+_RECV_BUFS = weakref.WeakKeyDictionary()
+
+
+def recv_response(sock):
+    """Receive one chunk into the socket's reused buffer and copy it out."""
+    buf = _RECV_BUFS.get(sock)
+    if buf is None:
+        buf = _RECV_BUFS[sock] = bytearray(4096)
+    n = sock.recv_into(buf)
+    return bytes(memoryview(buf)[:n])
+
+
+@functools.lru_cache(maxsize=64)
+def parse_cached(raw):
+    """Parse *raw* once per unique payload; callers must not mutate it."""
+    return parse_http_request(raw)
+
+
+@pytest.fixture
+def parsed(request):
+    """Parse the raw request bytes passed in via indirect parametrization.
+
+    Results go through parse_cached(), so identical bytes are usually only
+    parsed once. The returned dict is shared; do not mutate it.
+    """
+    return parse_cached(request.param)
+
+
+@pytest.fixture(scope="session")
+def server():
+    """Start a WSGIServer in a background thread on a random port.
+
+    Shared by every test in the session; none of them change server state.
+    Connections stay open for as long as the client keeps them alive.
+    """
+    srv = WSGIServer(_make_app(), host="127.0.0.1", port=0)
+    srv._sock = srv._create_socket()
+    port = srv._sock.getsockname()[1]
+    srv.port = port
+    srv._running = True
+    # Accepted connections are handled on a worker pool so concurrent
+    # clients are served in parallel instead of queueing behind each other.
+    pool = ThreadPoolExecutor(max_workers=16)
+
+    def handle(client_sock, client_addr):
+        try:
+            srv.serve_connection(client_sock, client_addr)
+        finally:
+            client_sock.close()
+
+    def run():
+        sel = selectors.DefaultSelector()
+        sel.register(srv._sock, selectors.EVENT_READ)
+        while srv._running:
+            events = sel.select(timeout=0.1)
+            for key, mask in events:
+                if key.fileobj is srv._sock:
+                    try:
+                        client_sock, client_addr = srv._sock.accept()
+                    except OSError:
+                        continue
+                    client_sock.setblocking(True)
+                    pool.submit(handle, client_sock, client_addr)
+        sel.unregister(srv._sock)
+        sel.close()
+        srv._sock.close()
+
+    thread = threading.Thread(target=run, daemon=True)
+    thread.start()
+    wait_for_port(port)
+
+    yield srv
+
+    srv._running = False
+    thread.join(timeout=2)
+    pool.shutdown(wait=True)
+
+
+@pytest.fixture(scope="class")
+def keepalive_sock(server):
+    """One connected TCP_NODELAY client socket shared by a test class."""
+    sock = socket.create_connection(("127.0.0.1", server.port))
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.settimeout(5)
+    yield sock
+    sock.close()
@@ -10,6 +10,8 @@ import time
 import pytest
 from cruet import Cruet
 
+from tests.test_server.conftest import recv_response
+
 # Check if libevent is available
 try:
     from cruet._cruet import run_event_loop
@@ -113,7 +115,7 @@ def _http_get(port, path="/", headers=None):
     response = b""
     while True:
         try:
-            chunk = sock.recv(4096)
+            chunk = recv_response(sock)
             if not chunk:
                 break
             response += chunk
@@ -151,7 +153,7 @@ def _http_post(port, path, body, content_type="text/plain"):
     response = b""
     while True:
         try:
-            chunk = sock.recv(4096)
+            chunk = recv_response(sock)
             if not chunk:
                 break
             response += chunk
@@ -217,14 +219,14 @@ class TestMultipleRequests:
         # First request
         sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
         time.sleep(0.1)
-        resp1 = sock.recv(4096)
+        resp1 = recv_response(sock)
         assert b"200 OK" in resp1
         assert b"Hello from async cruet!" in resp1
 
         # Second request on same socket
         sock.sendall(b"GET /json HTTP/1.1\r\nHost: localhost\r\n\r\n")
         time.sleep(0.1)
-        resp2 = sock.recv(4096)
+        resp2 = recv_response(sock)
         assert b"200 OK" in resp2
         assert b'"status"' in resp2
 
@@ -266,7 +268,7 @@ class TestErrorHandling:
         sock.sendall(b"NOT_HTTP garbage\r\n\r\n")
         time.sleep(0.2)
         try:
-            response = sock.recv(4096)
+            response = recv_response(sock)
             if response:
                 assert b"400" in response or b"500" in response
         except (socket.timeout, ConnectionResetError):
@@ -282,7 +284,7 @@ class TestErrorHandling:
         try:
             sock.sendall(request.encode())
             time.sleep(0.5)
-            response = sock.recv(4096)
+            response = recv_response(sock)
             if response:
                 assert b"413" in response
         except (BrokenPipeError, ConnectionResetError):
@@ -1,70 +1,18 @@
 """Tests for server connections using real sockets."""
 import socket
 import threading
-import time
+
 import pytest
-from cruet import Cruet
 from cruet.serving import WSGIServer
 
-
-@pytest.fixture
-def app():
-    app = Cruet(__name__)
-
-    @app.route("/")
-    def index():
-        return "Hello from cruet!"
-
-    @app.route("/json")
-    def json_view():
-        return {"status": "ok"}
-
-    return app
-
-
-@pytest.fixture
-def server(app):
-    """Start a server in a background thread on a random port."""
-    srv = WSGIServer(app, host="127.0.0.1", port=0)
-    srv._sock = srv._create_socket()
-    port = srv._sock.getsockname()[1]
-    srv.port = port
-    srv._running = True
-
-    def run():
-        import selectors
-        sel = selectors.DefaultSelector()
-        sel.register(srv._sock, selectors.EVENT_READ)
-        while srv._running:
-            events = sel.select(timeout=0.1)
-            for key, mask in events:
-                if key.fileobj is srv._sock:
-                    try:
-                        client_sock, client_addr = srv._sock.accept()
-                        client_sock.setblocking(True)
-                        srv.handle_request(client_sock, client_addr)
-                        client_sock.close()
-                    except OSError:
-                        pass
-        sel.unregister(srv._sock)
-        sel.close()
-        srv._sock.close()
-
-    thread = threading.Thread(target=run, daemon=True)
-    thread.start()
-    time.sleep(0.05)  # Let server start
-
-    yield srv
-
-    srv._running = False
-    thread.join(timeout=2)
+from tests.test_server.conftest import recv_response
 
 
 class TestSingleRequest:
     def test_get_request(self, server):
         sock = socket.create_connection(("127.0.0.1", server.port))
         sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
-        response = sock.recv(4096)
+        response = recv_response(sock)
         sock.close()
         assert b"200 OK" in response
         assert b"Hello from cruet!" in response
@@ -72,7 +20,7 @@ class TestSingleRequest:
     def test_get_json(self, server):
         sock = socket.create_connection(("127.0.0.1", server.port))
         sock.sendall(b"GET /json HTTP/1.1\r\nHost: localhost\r\n\r\n")
-        response = sock.recv(4096)
+        response = recv_response(sock)
         sock.close()
         assert b"200 OK" in response
         assert b'"status"' in response
@@ -83,7 +31,7 @@ class TestMultipleConnections:
         for _ in range(5):
             sock = socket.create_connection(("127.0.0.1", server.port))
             sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
-            response = sock.recv(4096)
+            response = recv_response(sock)
             sock.close()
             assert b"200 OK" in response
 
@@ -94,7 +42,7 @@ class TestMultipleConnections:
             try:
                 sock = socket.create_connection(("127.0.0.1", server.port))
                 sock.sendall(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n")
-                results[idx] = sock.recv(4096)
+                results[idx] = recv_response(sock)
                 sock.close()
             except Exception as e:
                 results[idx] = str(e).encode()
@@ -117,6 +65,29 @@ class TestNotFound:
     def test_404(self, server):
         sock = socket.create_connection(("127.0.0.1", server.port))
         sock.sendall(b"GET /nonexistent HTTP/1.1\r\nHost: localhost\r\n\r\n")
-        response = sock.recv(4096)
+        response = recv_response(sock)
         sock.close()
         assert b"404" in response
+
+
+@pytest.mark.skipif(not hasattr(socket, "SO_REUSEPORT"),
+                    reason="SO_REUSEPORT not available")
+class TestReusePort:
+    def test_second_listener_on_same_port(self):
+        """Two listening sockets can share a port and both accept."""
+        first = WSGIServer(None, host="127.0.0.1", port=0)._create_socket()
+        port = first.getsockname()[1]
+        second = WSGIServer(None, host="127.0.0.1", port=port)._create_socket()
+        try:
+            assert second.getsockname()[1] == port
+            # With the first listener gone, the kernel routes to the second.
+            first.close()
+            second.setblocking(True)
+            second.settimeout(5)
+            client = socket.create_connection(("127.0.0.1", port), timeout=5)
+            conn, _ = second.accept()
+            conn.close()
+            client.close()
+        finally:
+            first.close()
+            second.close()
@@ -1,111 +1,136 @@
 """Tests for the custom HTTP/1.1 request parser."""
+import time
+
 import pytest
-from cruet._cruet import parse_http_request
+from cruet._cruet import parse_http_request, parse_http_requests_batch
+
+GET_ROOT = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+FORM_BODY = b"name=John&age=30"
+POST_SUBMIT = (
+    b"POST /submit HTTP/1.1\r\n"
+    b"Host: localhost\r\n"
+    b"Content-Length: 16\r\n"
+    b"Content-Type: application/x-www-form-urlencoded\r\n"
+    b"\r\n" + FORM_BODY
+)
+JSON_BODY = b'{"key": "value"}'
+POST_API_JSON = (
+    b"POST /api HTTP/1.1\r\n"
+    b"Host: localhost\r\n"
+    b"Content-Length: 16\r\n"
+    b"\r\n" + JSON_BODY
+)
+
+
+def _parse_via_batch(raw):
+    return parse_http_requests_batch([raw])[0]
+
+
+@pytest.fixture(params=["single", "batch"])
+def parse(request):
+    """Run each parser test through both C entry points."""
+    if request.param == "single":
+        return parse_http_request
+    return _parse_via_batch
 
 
 class TestParseBasicRequests:
-    def test_simple_get(self):
-        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        result = parse_http_request(raw)
+    def test_simple_get(self, parse):
+        result = parse(GET_ROOT)
         assert result["method"] == "GET"
         assert result["path"] == "/"
         assert result["version"] == "HTTP/1.1"
         assert result["headers"]["Host"] == "localhost"
 
-    def test_get_with_path(self):
-        raw = b"GET /hello/world HTTP/1.1\r\nHost: example.com\r\n\r\n"
-        result = parse_http_request(raw)
+    @pytest.mark.parametrize("target,path,query_string", [
+        (b"/hello/world", "/hello/world", ""),
+        (b"/search?q=hello&page=1", "/search", "q=hello&page=1"),
+    ], ids=["path", "query-string"])
+    def test_get_target(self, parse, target, path, query_string):
+        raw = b"GET " + target + b" HTTP/1.1\r\nHost: example.com\r\n\r\n"
+        result = parse(raw)
         assert result["method"] == "GET"
-        assert result["path"] == "/hello/world"
-
-    def test_get_with_query_string(self):
-        raw = b"GET /search?q=hello&page=1 HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        result = parse_http_request(raw)
-        assert result["path"] == "/search"
-        assert result["query_string"] == "q=hello&page=1"
+        assert result["path"] == path
+        assert result["query_string"] == query_string
 
-    def test_post_request(self):
-        body = b"name=John&age=30"
-        raw = (
-            b"POST /submit HTTP/1.1\r\n"
-            b"Host: localhost\r\n"
-            b"Content-Length: " + str(len(body)).encode() + b"\r\n"
-            b"Content-Type: application/x-www-form-urlencoded\r\n"
-            b"\r\n" + body
-        )
-        result = parse_http_request(raw)
+    def test_post_request(self, parse):
+        result = parse(POST_SUBMIT)
         assert result["method"] == "POST"
         assert result["path"] == "/submit"
-        assert result["body"] == body
+        assert result["body"] == FORM_BODY
 
 
 class TestParseHeaders:
-    def test_single_header(self):
-        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        result = parse_http_request(raw)
-        assert result["headers"]["Host"] == "localhost"
-
-    def test_multiple_headers(self):
-        raw = (
-            b"GET / HTTP/1.1\r\n"
-            b"Host: localhost\r\n"
-            b"Accept: text/html\r\n"
-            b"User-Agent: test/1.0\r\n"
-            b"\r\n"
-        )
-        result = parse_http_request(raw)
-        assert result["headers"]["Host"] == "localhost"
-        assert result["headers"]["Accept"] == "text/html"
-        assert result["headers"]["User-Agent"] == "test/1.0"
-
-    def test_header_with_spaces_in_value(self):
-        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\nX-Custom: hello world\r\n\r\n"
-        result = parse_http_request(raw)
-        assert result["headers"]["X-Custom"] == "hello world"
-
-    def test_content_length_body(self):
-        body = b'{"key": "value"}'
-        raw = (
-            b"POST /api HTTP/1.1\r\n"
-            b"Host: localhost\r\n"
-            b"Content-Length: " + str(len(body)).encode() + b"\r\n"
-            b"\r\n" + body
-        )
-        result = parse_http_request(raw)
-        assert result["body"] == body
+    @pytest.mark.parametrize("header_lines,expected", [
+        (b"Host: localhost\r\n", {"Host": "localhost"}),
+        (
+            b"Host: localhost\r\nAccept: text/html\r\nUser-Agent: test/1.0\r\n",
+            {"Host": "localhost", "Accept": "text/html", "User-Agent": "test/1.0"},
+        ),
+        (
+            b"Host: localhost\r\nX-Custom: hello world\r\n",
+            {"Host": "localhost", "X-Custom": "hello world"},
+        ),
+    ], ids=["single", "multiple", "spaces-in-value"])
+    def test_headers(self, parse, header_lines, expected):
+        raw = b"GET / HTTP/1.1\r\n" + header_lines + b"\r\n"
+        result = parse(raw)
+        for name, value in expected.items():
+            assert result["headers"][name] == value
+
+    def test_content_length_body(self, parse):
+        result = parse(POST_API_JSON)
+        assert result["body"] == JSON_BODY
 
 
 class TestParseKeepAlive:
-    def test_http11_keep_alive_default(self):
-        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        result = parse_http_request(raw)
+    def test_http11_keep_alive_default(self, parse):
+        result = parse(GET_ROOT)
         assert result.get("keep_alive", True) is True
 
-    def test_connection_close(self):
+    def test_connection_close(self, parse):
         raw = b"GET / HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
-        result = parse_http_request(raw)
+        result = parse(raw)
         assert result["keep_alive"] is False
 
 
 class TestParseMalformed:
-    def test_incomplete_request_line(self):
+    def test_incomplete_request_line(self, parse):
         raw = b"GET / HTTP"
-        result = parse_http_request(raw)
+        result = parse(raw)
         assert result is None or result.get("error")
 
-    def test_no_headers(self):
+    def test_no_headers(self, parse):
         raw = b"GET / HTTP/1.1\r\n\r\n"
-        result = parse_http_request(raw)
+        result = parse(raw)
         # Should still parse - Host is not strictly required for parsing
         assert result["method"] == "GET"
 
-    def test_empty_input(self):
-        result = parse_http_request(b"")
+    def test_empty_input(self, parse):
+        result = parse(b"")
         assert result is None or result.get("error")
 
 
+class TestParseHeaderTerminator:
+    @pytest.mark.parametrize("pad", [0, 1, 15, 16, 31, 32, 33, 100, 1000])
+    def test_header_terminator_alignment(self, parse, pad):
+        raw = b"GET / HTTP/1.1\r\nX: " + b"a" * pad + b"\r\n\r\n"
+        result = parse(raw)
+        assert result["method"] == "GET"
+        assert result["headers"]["X"] == "a" * pad
+
+    @pytest.mark.parametrize("pad", [0, 1, 31, 32, 33])
+    def test_lone_cr_in_value(self, parse, pad):
+        raw = b"GET / HTTP/1.1\r\nX: " + b"a" * pad + b"\rb\r\n\r\n"
+        result = parse(raw)
+        assert result["headers"]["X"] == "a" * pad + "\rb"
+
+    def test_trailing_cr_is_incomplete(self, parse):
+        assert parse(b"GET / HTTP/1.1\r") is None
+
+
 class TestParsePartialReads:
-    def test_body_length_match(self):
+    def test_body_length_match(self, parse):
         body = b"hello"
         raw = (
             b"POST / HTTP/1.1\r\n"
@@ -113,34 +138,66 @@ class TestParsePartialReads:
             b"Content-Length: 5\r\n"
             b"\r\n" + body
         )
-        result = parse_http_request(raw)
+        result = parse(raw)
         assert result["body"] == b"hello"
         assert len(result["body"]) == 5
 
 
 class TestParseHTTPMethods:
-    def test_put(self):
-        raw = b"PUT /resource HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        result = parse_http_request(raw)
-        assert result["method"] == "PUT"
-
-    def test_delete(self):
-        raw = b"DELETE /resource/42 HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        result = parse_http_request(raw)
-        assert result["method"] == "DELETE"
-
-    def test_head(self):
-        raw = b"HEAD / HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        result = parse_http_request(raw)
-        assert result["method"] == "HEAD"
-
-    def test_options(self):
-        raw = b"OPTIONS * HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        result = parse_http_request(raw)
-        assert result["method"] == "OPTIONS"
-
-    def test_patch(self):
-        raw = b"PATCH /resource HTTP/1.1\r\nHost: localhost\r\nContent-Length: 3\r\n\r\nabc"
-        result = parse_http_request(raw)
-        assert result["method"] == "PATCH"
-        assert result["body"] == b"abc"
+    @pytest.mark.parametrize("method,path,extra,body", [
+        ("GET", "/", b"", b""),
+        ("POST", "/resource", b"Content-Length: 3\r\n", b"abc"),
+        ("PUT", "/resource", b"", b""),
+        ("DELETE", "/resource/42", b"", b""),
+        ("HEAD", "/", b"", b""),
+        ("OPTIONS", "*", b"", b""),
+        ("PATCH", "/resource", b"Content-Length: 3\r\n", b"abc"),
+        ("TRACE", "/", b"", b""),
+        ("CONNECT", "example.com:443", b"", b""),
+        ("POSTX", "/", b"", b""),
+        ("P", "/", b"", b""),
+    ], ids=[
+        "GET", "POST", "PUT", "DELETE", "HEAD", "OPTIONS", "PATCH", "TRACE",
+        "CONNECT", "POSTX", "P",
+    ])
+    def test_method(self, parse, method, path, extra, body):
+        raw = (
+            f"{method} {path} HTTP/1.1\r\nHost: localhost\r\n".encode()
+            + extra + b"\r\n" + body
+        )
+        result = parse(raw)
+        assert result["method"] == method
+        assert result["path"] == path
+        if body:
+            assert result["body"] == body
+
+
+class TestParseBatch:
+    def test_batch_parse_roundtrip(self):
+        results = parse_http_requests_batch([GET_ROOT] * 64)
+        assert len(results) == 64
+        assert all(r["method"] == "GET" for r in results)
+
+    def test_batch_matches_single_parse(self):
+        raws = [GET_ROOT, POST_SUBMIT, POST_API_JSON, b"GET / HTTP", b""]
+        assert parse_http_requests_batch(raws) == [
+            parse_http_request(raw) for raw in raws
+        ]
+
+    def test_batch_empty(self):
+        assert parse_http_requests_batch([]) == []
+
+    def test_batch_rejects_non_bytes(self):
+        with pytest.raises(TypeError):
+            parse_http_requests_batch([GET_ROOT, "GET / HTTP/1.1\r\n\r\n"])
+
+
+class TestParseThroughput:
+    def test_parse_throughput_regression(self):
+        """Loose ns/op ceiling: catches large slowdowns, not CI noise."""
+        n = 10000
+        t0 = time.perf_counter_ns()
+        for _ in range(n):
+            parse_http_request(GET_ROOT)
+        ns_per = (time.perf_counter_ns() - t0) / n
+        assert ns_per < 50_000, f"{ns_per:.0f} ns/parse"
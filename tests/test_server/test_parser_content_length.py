@@ -0,0 +1,202 @@
+"""Content-Length and body-framing edge cases for the C HTTP/1.1 parser."""
+import pytest
+from cruet._cruet import parse_http_request
+
+_LONG_MAX = str(2**63 - 1).encode()  # LONG_MAX on 64-bit
+
+
+def _post(body, clen=None, extra_headers=b""):
+    """Build a ``POST /`` request with *body*.
+
+    *clen* defaults to ``len(body)``; pass bytes to send a raw (possibly
+    invalid) Content-Length value. *extra_headers* follow Content-Length.
+    """
+    if clen is None:
+        clen = len(body)
+    if isinstance(clen, int):
+        clen = b"%d" % clen
+    return b"".join((
+        b"POST / HTTP/1.1\r\nHost: localhost\r\nContent-Length: ", clen,
+        b"\r\n", extra_headers, b"\r\n", body,
+    ))
+
+
+def _get(path=b"/", headers=b""):
+    """Build a ``GET`` request for *path* with optional extra *headers*."""
+    return b"".join((
+        b"GET ", path, b" HTTP/1.1\r\nHost: localhost\r\n", headers, b"\r\n",
+    ))
+
+
+_ALL_BYTES = bytes(range(256))
+_BINARY_POST = _post(_ALL_BYTES, clen=b"256")
+
+
+class TestContentLength:
+    def test_negative_content_length(self):
+        """Negative Content-Length should be handled gracefully."""
+        result = parse_http_request(_post(b"", clen=b"-1"))
+        # Should parse without crash; body should be empty
+        assert result is not None
+        assert result["body"] == b""
+
+    def test_non_numeric_content_length(self):
+        """Non-numeric Content-Length should be handled gracefully."""
+        result = parse_http_request(_post(b"", clen=b"abc"))
+        assert result is not None
+
+    def test_zero_content_length(self):
+        """Content-Length: 0 should produce empty body."""
+        result = parse_http_request(_post(b""))
+        assert result is not None
+        assert result["body"] == b""
+
+    def test_multiple_content_length_headers(self):
+        """Multiple Content-Length headers (conflicting values)."""
+        raw = _post(b"hello", extra_headers=b"Content-Length: 10\r\n")
+        result = parse_http_request(raw)
+        # Should handle gracefully -- last value wins or first value wins
+        assert result is not None
+        assert result["content_length_count"] == 2
+
+    def test_content_length_count(self):
+        assert parse_http_request(_post(b"hello"))["content_length_count"] == 1
+        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        assert parse_http_request(raw)["content_length_count"] == 0
+
+    @pytest.mark.slow
+    def test_very_large_content_length(self):
+        """Extremely large Content-Length with small body."""
+        result = parse_http_request(_post(b"small body", clen=999999999))
+        # Should parse what's available without allocating huge buffer
+        assert result is not None
+
+
+class TestContentLengthOverflow:
+    def test_content_length_long_max(self):
+        """Content-Length = LONG_MAX should not crash or allocate huge memory."""
+        result = parse_http_request(_post(b"tiny", clen=_LONG_MAX))
+        assert result is not None
+        # Must not crash; body should be whatever is available
+        assert isinstance(result["body"], bytes)
+
+    def test_content_length_exceeds_long_max(self):
+        """Content-Length larger than LONG_MAX should not crash."""
+        huge = str(2**63 + 1)
+        result = parse_http_request(_post(b"body", clen=huge.encode()))
+        assert result is not None
+        assert isinstance(result["body"], bytes)
+
+    def test_content_length_extremely_large_string(self):
+        """Content-Length that's a very large number string (>32 chars)."""
+        # This exceeds the tmp[32] buffer so Content-Length parsing is skipped
+        huge_num = "9" * 40
+        result = parse_http_request(_post(b"body", clen=huge_num.encode()))
+        assert result is not None
+        # Content-Length was too long for tmp[32], so body defaults to empty
+        assert result["body"] == b""
+
+    def test_content_length_negative_not_minus_one(self):
+        """Content-Length = -5 (negative but not -1) should handle safely."""
+        result = parse_http_request(_post(b"hello", clen=b"-5"))
+        assert result is not None
+        assert isinstance(result["body"], bytes)
+
+    def test_content_length_negative_large(self):
+        """Content-Length = -999999999 should handle safely."""
+        result = parse_http_request(_post(b"data", clen=b"-999999999"))
+        assert result is not None
+        assert isinstance(result["body"], bytes)
+
+    def test_content_length_with_leading_zeros(self):
+        """Content-Length with leading zeros."""
+        result = parse_http_request(_post(b"hello", clen=b"005"))
+        assert result is not None
+        assert result["body"] == b"hello"
+
+    def test_content_length_hex_prefix(self):
+        """Content-Length with 0x prefix (strtol interprets base 10)."""
+        result = parse_http_request(_post(b"body", clen=b"0x10"))
+        assert result is not None
+        assert isinstance(result["body"], bytes)
+
+    def test_content_length_with_whitespace(self):
+        """Content-Length with extra whitespace."""
+        result = parse_http_request(_post(b"0123456789", clen=b"  10  "))
+        assert result is not None
+
+
+class TestBodyEdgeCases:
+    def test_body_exactly_matches_content_length(self):
+        """Body length exactly matches Content-Length."""
+        result = parse_http_request(_post(b"hello"))
+        assert result is not None
+        assert result["body"] == b"hello"
+
+    def test_body_longer_than_content_length(self):
+        """Body provided is longer than Content-Length — should truncate."""
+        result = parse_http_request(_post(b"hello extra data", clen=3))
+        assert result is not None
+        assert result["body"] == b"hel"
+
+    def test_body_shorter_than_content_length(self):
+        """Body is shorter than Content-Length — returns what's available."""
+        result = parse_http_request(_post(b"short", clen=100))
+        assert result is not None
+        assert b"short" in result["body"]
+
+    def test_get_with_body(self):
+        """GET with Content-Length and body (unusual but valid HTTP)."""
+        raw = _get(headers=b"Content-Length: 4\r\n") + b"data"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["body"] == b"data"
+
+    def test_post_without_content_length(self):
+        """POST without Content-Length — body should be empty."""
+        raw = (
+            b"POST / HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"\r\n"
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["body"] == b""
+
+    @pytest.mark.slow
+    def test_binary_body(self):
+        """Binary body with all byte values 0-255."""
+        assert len(_ALL_BYTES) == 256
+        result = parse_http_request(_BINARY_POST)
+        assert result is not None
+        assert result["body"] == _ALL_BYTES
+
+
+class TestPipelinedRequests:
+    def test_extra_data_after_complete_request(self):
+        """Data after a complete request (next pipelined request)."""
+        raw = (
+            b"GET /first HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"\r\n"
+            b"GET /second HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"\r\n"
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["path"] == "/first"
+        # Parser should only parse the first request
+
+    def test_post_followed_by_get(self):
+        """POST with body followed by GET (pipelined)."""
+        raw = (
+            b"POST / HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Length: 5\r\n"
+            b"\r\n"
+            b"helloGET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["body"] == b"hello"
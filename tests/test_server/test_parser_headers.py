@@ -0,0 +1,161 @@
+"""Header-parsing edge cases for the C HTTP/1.1 parser."""
+import pytest
+from cruet._cruet import parse_http_request
+
+# Built once at import; TestManyHeaders is the only user.
+_THOUSAND_HEADERS = b"".join(
+    [b"X-Header-%d: value-%d\r\n" % (i, i) for i in range(1000)]
+)
+_THOUSAND_HEADERS_REQUEST = (
+    b"GET / HTTP/1.1\r\nHost: localhost\r\n" + _THOUSAND_HEADERS + b"\r\n"
+)
+
+# Odd headers that should still parse: (id, raw request bytes).
+_ODD_HEADER_CASES = (
+    ("empty_header_name", b"GET / HTTP/1.1\r\nHost: localhost\r\n: value\r\n\r\n"),
+    ("only_whitespace_value",
+     b"GET / HTTP/1.1\r\nHost: localhost\r\nX-Space:   \r\n\r\n"),
+)
+_ODD_HEADER_IDS, _ODD_HEADER_REQUESTS = zip(*_ODD_HEADER_CASES)
+
+
+class TestMalformedHeaders:
+    def test_missing_colon_in_header(self):
+        """Header line without colon should be skipped gracefully."""
+        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\nNoColonHere\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["method"] == "GET"
+        # The malformed header should be skipped
+        assert "NoColonHere" not in result["headers"]
+
+    def test_empty_header_value(self):
+        """Empty header value should be accepted."""
+        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\nX-Empty:\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["headers"].get("X-Empty", "").strip() == ""
+
+    @pytest.mark.parametrize("raw", _ODD_HEADER_REQUESTS, ids=_ODD_HEADER_IDS)
+    def test_odd_header_still_parses(self, raw):
+        """Empty names and whitespace-only values should still parse."""
+        result = parse_http_request(raw)
+        assert result is not None
+
+
+class TestManyHeaders:
+    @pytest.mark.slow
+    def test_1000_headers(self):
+        """Request with 1000+ headers should not crash."""
+        result = parse_http_request(_THOUSAND_HEADERS_REQUEST)
+        assert result is not None
+        assert result["method"] == "GET"
+
+
+class TestHeaderEdgeCases:
+    def test_duplicate_headers(self):
+        """Duplicate header names — last value wins (dict semantics)."""
+        raw = (
+            b"GET / HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"X-Test: first\r\n"
+            b"X-Test: second\r\n"
+            b"\r\n"
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["headers"]["X-Test"] == "second"
+
+    def test_header_with_colon_in_value(self):
+        """Header value containing colon characters."""
+        raw = (
+            b"GET / HTTP/1.1\r\n"
+            b"Host: localhost:8080\r\n"
+            b"\r\n"
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["headers"]["Host"] == "localhost:8080"
+
+    def test_header_case_preservation(self):
+        """Header names should be preserved as-is."""
+        raw = (
+            b"GET / HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"X-Custom-Header: value\r\n"
+            b"\r\n"
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        assert "X-Custom-Header" in result["headers"]
+
+    def test_header_with_many_colons(self):
+        """Header value with multiple colons (e.g. IPv6, time)."""
+        raw = (
+            b"GET / HTTP/1.1\r\n"
+            b"Host: [::1]:8080\r\n"
+            b"X-Time: 12:30:45\r\n"
+            b"\r\n"
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["headers"]["X-Time"] == "12:30:45"
+
+    def test_header_continuation_not_supported(self):
+        """Obsolete header continuation (line starting with space/tab)."""
+        raw = (
+            b"GET / HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"X-Long: start\r\n"
+            b" continuation\r\n"
+            b"\r\n"
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        # The continuation line has no colon, so it's skipped
+
+    def test_content_type_header(self):
+        """Content-Type header should be parsed normally."""
+        raw = (
+            b"POST / HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Type: application/json; charset=utf-8\r\n"
+            b"Content-Length: 2\r\n"
+            b"\r\n"
+            b"{}"
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        assert "application/json" in result["headers"]["Content-Type"]
+
+
+class TestKeepAlive:
+    @pytest.mark.parametrize("parsed,expected", [
+        pytest.param(b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n", True,
+                     id="http11_default_keep_alive"),
+        pytest.param(b"GET / HTTP/1.1\r\nHost: localhost\r\n"
+                     b"Connection: close\r\n\r\n", False,
+                     id="http11_connection_close"),
+        pytest.param(b"GET / HTTP/1.1\r\nHost: localhost\r\n"
+                     b"Connection: keep-alive\r\n\r\n", True,
+                     id="connection_keep_alive_header"),
+        # Parser uses strncasecmp for the Connection header value
+        pytest.param(b"GET / HTTP/1.1\r\nHost: localhost\r\n"
+                     b"Connection: Close\r\n\r\n", False,
+                     id="connection_close_case_insensitive"),
+    ], indirect=["parsed"])
+    def test_keep_alive_flag(self, parsed, expected):
+        """Connection header and HTTP/1.1 default decide keep_alive."""
+        assert parsed is not None
+        assert parsed["keep_alive"] is expected
+
+    @pytest.mark.parametrize("parsed", [
+        pytest.param(b"GET / HTTP/1.0\r\nHost: localhost\r\n\r\n",
+                     id="http10_request"),
+    ], indirect=True)
+    def test_http10_keep_alive_is_default(self, parsed):
+        """HTTP/1.0 — parser defaults keep_alive=1 (HTTP/1.1 default)."""
+        assert parsed is not None
+        # Parser sets keep_alive=1 by default for all versions
+        # The server layer handles HTTP/1.0 semantics
+        assert "keep_alive" in parsed
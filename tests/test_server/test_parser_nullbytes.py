@@ -0,0 +1,60 @@
+"""Null-byte and CR/LF injection tests for the C HTTP/1.1 parser."""
+import pytest
+from cruet._cruet import parse_http_request
+
+# "Should not crash" payloads, grouped by family: (id, raw request bytes).
+_NULL_BYTE_CASES = (
+    ("in_path", b"GET /hello\x00world HTTP/1.1\r\nHost: localhost\r\n\r\n"),
+    ("in_header_value",
+     b"GET / HTTP/1.1\r\nHost: localhost\r\nX-Evil: hello\x00world\r\n\r\n"),
+    ("in_header_name",
+     b"GET / HTTP/1.1\r\nHost: localhost\r\nX-\x00Evil: value\r\n\r\n"),
+    ("in_method", b"GE\x00T / HTTP/1.1\r\nHost: localhost\r\n\r\n"),
+)
+_BARE_LINE_ENDING_CASES = (
+    ("bare_cr", b"GET / HTTP/1.1\r\nHost: localhost\r\nX-Test: val\rue\r\n\r\n"),
+    ("bare_lf", b"GET / HTTP/1.1\r\nHost: localhost\r\nX-Test: val\nue\r\n\r\n"),
+)
+_NULL_BYTE_IDS, _NULL_BYTE_REQUESTS = zip(*_NULL_BYTE_CASES)
+_BARE_LINE_ENDING_IDS, _BARE_LINE_ENDING_REQUESTS = zip(*_BARE_LINE_ENDING_CASES)
+
+
+class TestNullBytes:
+    @pytest.mark.parametrize("raw", _NULL_BYTE_REQUESTS, ids=_NULL_BYTE_IDS)
+    def test_null_byte_does_not_crash(self, raw):
+        """Null bytes anywhere in the head should not crash the parser."""
+        result = parse_http_request(raw)
+        # Should parse (null is just a byte) or return None
+        assert result is None or isinstance(result, dict)
+
+    def test_null_byte_in_body(self):
+        """Null bytes in body should be preserved."""
+        body = b"hello\x00world"
+        assert len(body) == 11
+        raw = (
+            b"POST / HTTP/1.1\r\n"
+            b"Host: localhost\r\n"
+            b"Content-Length: 11\r\n"
+            b"\r\n" + body
+        )
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["body"] == body
+
+
+class TestCRLFInjection:
+    def test_crlf_injection_in_header_value(self):
+        """CRLF in header value should not inject extra headers."""
+        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\nX-Evil: value\r\nInjected: yes\r\n\r\n"
+        result = parse_http_request(raw)
+        # The parser sees \r\n as end of the X-Evil header line,
+        # then "Injected: yes" as a separate header - this is normal parsing.
+        assert result is not None
+        assert result["headers"]["Host"] == "localhost"
+
+    @pytest.mark.parametrize("raw", _BARE_LINE_ENDING_REQUESTS,
+                             ids=_BARE_LINE_ENDING_IDS)
+    def test_bare_line_ending_does_not_crash(self, raw):
+        """Bare \\r or \\n (not a CRLF pair) in a header value."""
+        result = parse_http_request(raw)
+        assert result is None or isinstance(result, dict)
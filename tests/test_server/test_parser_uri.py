@@ -0,0 +1,141 @@
+"""Request-line, URI and method edge cases for the C HTTP/1.1 parser."""
+import pytest
+from cruet._cruet import parse_http_request
+
+# Odd request lines that must not crash: (id, raw request bytes).
+_ODD_REQUEST_LINE_CASES = (
+    ("empty_method", b" / HTTP/1.1\r\nHost: localhost\r\n\r\n"),
+    ("empty_path", b"GET  HTTP/1.1\r\nHost: localhost\r\n\r\n"),
+    ("extra_spaces", b"GET  /  HTTP/1.1\r\nHost: localhost\r\n\r\n"),
+    ("tab_instead_of_space", b"GET\t/\tHTTP/1.1\r\nHost: localhost\r\n\r\n"),
+    ("only_crlf", b"\r\n\r\n"),
+    ("leading_crlf", b"\r\nGET / HTTP/1.1\r\nHost: localhost\r\n\r\n"),
+)
+_ODD_REQUEST_LINE_IDS, _ODD_REQUEST_LINES = zip(*_ODD_REQUEST_LINE_CASES)
+_STD_METHODS = [
+    (m, m.encode() + b" / HTTP/1.1\r\nHost: localhost\r\n\r\n")
+    for m in ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS",
+              "TRACE", "CONNECT")
+]
+
+
+class TestRequestLine:
+    @pytest.mark.parametrize("parsed", _ODD_REQUEST_LINES,
+                             ids=_ODD_REQUEST_LINE_IDS, indirect=True)
+    def test_odd_request_line_does_not_crash(self, parsed):
+        """Odd request lines may parse or return None, but must not crash."""
+        assert parsed is None or isinstance(parsed, dict)
+
+    def test_very_long_method(self):
+        """Very long method name should not crash."""
+        method = "A" * 1000
+        raw = f"{method} / HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+        result = parse_http_request(raw)
+        if result is not None:
+            assert result["method"] == method
+
+
+class TestURIParsing:
+    def test_uri_with_fragment(self):
+        """URI with fragment (#) — fragment should be part of path."""
+        raw = b"GET /page#section HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        # Fragment is not split from path by the parser
+        assert "page" in result["path"]
+
+    def test_uri_with_query_and_fragment(self):
+        """URI with both query string and fragment."""
+        raw = b"GET /page?key=val#frag HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["path"] == "/page"
+        assert "key=val" in result["query_string"]
+
+    def test_uri_only_question_mark(self):
+        """URI with only a question mark (empty query string)."""
+        raw = b"GET /page? HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["path"] == "/page"
+        assert result["query_string"] == ""
+
+    def test_uri_multiple_question_marks(self):
+        """URI with multiple ? characters."""
+        raw = b"GET /page?a=1?b=2 HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["path"] == "/page"
+        # Everything after first ? is query string
+        assert "a=1?b=2" == result["query_string"]
+
+    def test_uri_encoded_space(self):
+        """URI with percent-encoded characters."""
+        raw = b"GET /hello%20world HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["path"] == "/hello%20world"
+
+    def test_absolute_uri(self):
+        """Absolute URI (proxy-style request)."""
+        raw = b"GET http://example.com/path HTTP/1.1\r\nHost: example.com\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["method"] == "GET"
+
+    def test_asterisk_uri(self):
+        """OPTIONS with asterisk URI."""
+        raw = b"OPTIONS * HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["method"] == "OPTIONS"
+        assert result["path"] == "*"
+
+
+class TestHTTPMethods:
+    @pytest.mark.parametrize("method,raw", _STD_METHODS,
+                             ids=[m for m, _ in _STD_METHODS])
+    def test_standard_methods(self, method, raw):
+        """All standard HTTP methods should parse."""
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["method"] == method
+
+    def test_custom_method(self):
+        """Non-standard method should parse."""
+        raw = b"PROPFIND / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["method"] == "PROPFIND"
+
+    def test_lowercase_method(self):
+        """Lowercase method should parse (HTTP is case-sensitive for method)."""
+        raw = b"get / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["method"] == "get"
+
+
+class TestHTTPVersions:
+    def test_http10_keep_alive_default_false(self):
+        """HTTP/1.0 requests should default keep_alive to False."""
+        raw = b"GET / HTTP/1.0\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        assert result is not None
+        assert result["method"] == "GET"
+        assert result["version"] == "HTTP/1.0"
+        # HTTP/1.0 default is no keep-alive (parser may or may not handle this)
+
+    def test_http09_request(self):
+        """HTTP/0.9 style request should be handled or rejected."""
+        raw = b"GET /\r\n"
+        result = parse_http_request(raw)
+        # May return None since it doesn't match expected format
+        assert result is None or isinstance(result, dict)
+
+    def test_unknown_version(self):
+        """Unknown HTTP version should still parse."""
+        raw = b"GET / HTTP/2.0\r\nHost: localhost\r\n\r\n"
+        result = parse_http_request(raw)
+        if result is not None:
+            assert result["version"] == "HTTP/2.0"
@@ -1,9 +1,13 @@
 """Tests for UNIX socket support in the async server."""
+import gc
 import os
+import re
 import signal
 import socket
 import tempfile
 import time
+from concurrent.futures import ThreadPoolExecutor
+
 import pytest
 from cruet import Cruet
 
@@ -19,7 +23,7 @@ pytestmark = pytest.mark.skipif(
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def app():
     app = Cruet(__name__)
 
@@ -34,13 +38,51 @@ def app():
     return app
 
 
-@pytest.fixture
-def unix_server(app):
-    """Start async server on a temp UNIX socket."""
-    tmpdir = tempfile.mkdtemp()
-    sock_path = os.path.join(tmpdir, "cruet_test.sock")
+def _stop_server(pid, timeout=1.0):
+    """SIGTERM *pid* and reap it, escalating to SIGKILL after *timeout*."""
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except ProcessLookupError:
+        pass
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            done, _ = os.waitpid(pid, os.WNOHANG)
+        except ChildProcessError:
+            return
+        if done == pid:
+            return
+        time.sleep(0.005)
+    try:
+        os.kill(pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    try:
+        os.waitpid(pid, 0)
+    except ChildProcessError:
+        pass
+
 
-    pid = os.fork()
+def _spawn_unix_server(app, sock_path):
+    """Fork a child serving *app* on *sock_path* and return its pid.
+
+    The parent binds and listens before forking and the child inherits the
+    fd, so connections queue in the backlog from the moment this returns;
+    no readiness polling is needed.
+    """
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(sock_path)
+    listener.listen(128)
+    listener.setblocking(False)
+    # Freeze the parent's heap into the permanent generation so the child's
+    # collector never walks (and copies) pages it inherited from pytest.
+    gc.freeze()
+    try:
+        pid = os.fork()
+    except BaseException:
+        gc.unfreeze()
+        listener.close()
+        raise
     if pid == 0:
         try:
             run_event_loop(
@@ -50,41 +92,30 @@ def unix_server(app):
                 read_timeout=5,
                 write_timeout=5,
                 max_request_size=1048576,
+                listen_fd=listener.fileno(),
             )
         except Exception:
             pass
         os._exit(0)
+    gc.unfreeze()
+    listener.close()
+    return pid
 
-    # Wait for socket file to appear
-    deadline = time.time() + 5
-    while time.time() < deadline:
-        if os.path.exists(sock_path):
-            # Try connecting
-            try:
-                s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                s.connect(sock_path)
-                s.close()
-                break
-            except (ConnectionRefusedError, OSError):
-                time.sleep(0.05)
-        else:
-            time.sleep(0.05)
-    else:
-        os.kill(pid, signal.SIGTERM)
-        os.waitpid(pid, 0)
-        pytest.skip("UNIX socket server did not start in time")
+
+@pytest.fixture(scope="module")
+def unix_server(app):
+    """Start async server on a temp UNIX socket, shared by the module.
+
+    Tests only send GETs, so one server process serves all of them.
+    """
+    tmpdir = tempfile.mkdtemp()
+    sock_path = os.path.join(tmpdir, "cruet_test.sock")
+    pid = _spawn_unix_server(app, sock_path)
 
     yield sock_path, pid
 
     # Cleanup
-    try:
-        os.kill(pid, signal.SIGTERM)
-    except ProcessLookupError:
-        pass
-    try:
-        os.waitpid(pid, 0)
-    except ChildProcessError:
-        pass
+    _stop_server(pid)
     # Clean up temp files
     try:
         os.unlink(sock_path)
@@ -96,34 +127,85 @@ def unix_server(app):
         pass
 
 
-def _unix_http_get(sock_path, path="/"):
-    """Send HTTP GET over UNIX socket."""
+_CONTENT_LENGTH_RE = re.compile(rb"(?im)^content-length:\s*(\d+)\s*$")
+_REQ_PREFIX = b"GET "
+_REQ_SUFFIX = b" HTTP/1.1\r\nHost: localhost\r\n\r\n"
+_REQ_CLOSE_SUFFIX = b" HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n\r\n"
+
+
+def _read_response(sock):
+    """Read one Content-Length framed response from *sock*.
+
+    The response is received in place into one 64 KiB buffer, which is
+    plenty for every endpoint these tests hit.
+    """
+    buf = bytearray(65536)
+    view = memoryview(buf)
+    total = 0
+    header_end = -1
+    content_length = None
+    while total < len(buf):
+        try:
+            n = sock.recv_into(view[total:])
+        except socket.timeout:
+            break
+        if n == 0:
+            break
+        total += n
+        if header_end < 0:
+            header_end = buf.find(b"\r\n\r\n", 0, total)
+            if header_end < 0:
+                continue
+            m = _CONTENT_LENGTH_RE.search(buf, 0, header_end)
+            if m is None:
+                break
+            content_length = int(m.group(1))
+            # Pull the rest of a known-size body in one syscall.
+            missing = content_length - (total - header_end - 4)
+            if 0 < missing <= len(buf) - total:
+                try:
+                    total += sock.recv_into(view[total:], missing,
+                                            socket.MSG_WAITALL)
+                except OSError:
+                    continue
+        if total - (header_end + 4) >= content_length:
+            break
+    return bytes(view[:total])
+
+
+def _unix_http_get_on(sock, path="/"):
+    """Send a keep-alive GET on an open socket and read one response."""
+    sock.sendall(_REQ_PREFIX + path.encode("ascii") + _REQ_SUFFIX)
+    return _read_response(sock)
+
+
+def _unix_http_get(sock_path, path="/", close=True):
+    """Send HTTP GET over UNIX socket.
+
+    With *close*, the request asks for ``Connection: close`` and the
+    response is simply read until EOF.
+    """
     sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
     sock.settimeout(5)
     sock.connect(sock_path)
-    req = f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n"
-    sock.sendall(req.encode())
-    response = b""
-    while True:
-        try:
-            chunk = sock.recv(4096)
-            if not chunk:
+    try:
+        if not close:
+            return _unix_http_get_on(sock, path)
+        sock.sendall(_REQ_PREFIX + path.encode("ascii") + _REQ_CLOSE_SUFFIX)
+        buf = bytearray(65536)
+        view = memoryview(buf)
+        total = 0
+        while total < len(buf):
+            try:
+                n = sock.recv_into(view[total:])
+            except socket.timeout:
                 break
-            response += chunk
-            if b"\r\n\r\n" in response:
-                header_part = response.split(b"\r\n\r\n", 1)[0]
-                body_part = response.split(b"\r\n\r\n", 1)[1]
-                for line in header_part.split(b"\r\n"):
-                    if line.lower().startswith(b"content-length:"):
-                        cl = int(line.split(b":")[1].strip())
-                        if len(body_part) >= cl:
-                            sock.close()
-                            return response
+            if n == 0:
                 break
-        except socket.timeout:
-            break
-    sock.close()
-    return response
+            total += n
+        return bytes(view[:total])
+    finally:
+        sock.close()
 
 
 class TestUnixSocketBasic:
@@ -150,33 +232,32 @@ class TestUnixSocketBasic:
 
 class TestUnixSocketMultiple:
     def test_multiple_requests(self, unix_server):
-        """Multiple requests on UNIX socket."""
+        """Multiple keep-alive requests on one UNIX socket connection."""
         sock_path, _ = unix_server
-        for _ in range(5):
-            response = _unix_http_get(sock_path, "/")
-            assert b"200 OK" in response
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(5)
+        sock.connect(sock_path)
+        try:
+            for _ in range(5):
+                response = _unix_http_get_on(sock, "/")
+                assert b"200 OK" in response
+        finally:
+            sock.close()
 
     def test_concurrent_unix_connections(self, unix_server):
         """Concurrent connections over UNIX socket."""
         sock_path, _ = unix_server
-        import threading
 
-        results = [None] * 10
-
-        def make_request(idx):
+        def make_request(_):
             try:
-                results[idx] = _unix_http_get(sock_path, "/")
+                return _unix_http_get(sock_path, "/")
             except Exception as e:
-                results[idx] = str(e).encode()
+                return str(e).encode()
 
-        threads = [threading.Thread(target=make_request, args=(i,))
-                   for i in range(10)]
-        for t in threads:
-            t.start()
-        for t in threads:
-            t.join(timeout=10)
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            results = list(pool.map(make_request, range(10)))
 
-        success = sum(1 for r in results if r and b"200 OK" in r)
+        success = sum(1 for r in results if b"200 OK" in r)
         assert success >= 8, f"Only {success}/10 succeeded"
 
 
@@ -191,40 +272,21 @@ class TestUnixSocketLifecycle:
         tmpdir = tempfile.mkdtemp()
         sock_path = os.path.join(tmpdir, "cleanup_test.sock")
 
-        pid = os.fork()
-        if pid == 0:
-            try:
-                run_event_loop(
-                    app,
-                    unix_path=sock_path,
-                    read_timeout=5,
-                    write_timeout=5,
-                )
-            except Exception:
-                pass
-            os._exit(0)
-
-        # Wait for server to start
-        deadline = time.time() + 5
-        while time.time() < deadline:
-            if os.path.exists(sock_path):
-                try:
-                    s = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
-                    s.connect(sock_path)
-                    s.close()
-                    break
-                except (ConnectionRefusedError, OSError):
-                    time.sleep(0.05)
-            else:
-                time.sleep(0.05)
-
-        # Send SIGTERM
-        os.kill(pid, signal.SIGTERM)
-        os.waitpid(pid, 0)
+        pid = _spawn_unix_server(app, sock_path)
+        # A served request proves the event loop (and its SIGTERM handler)
+        # is running; the listening fd alone only shows it was inherited.
+        assert b"200 OK" in _unix_http_get(sock_path, "/")
 
-        # Socket file should be cleaned up by the C code
-        time.sleep(0.1)
-        # The C event loop unlinks the socket on shutdown
+        # Send SIGTERM (a SIGKILL fallback would leave the file behind)
+        _stop_server(pid)
+
+        # The C event loop unlinks the socket on shutdown, before exiting,
+        # so this normally passes on the first check.
+        deadline = time.perf_counter() + 1.0
+        while time.perf_counter() < deadline:
+            if not os.path.exists(sock_path):
+                break
+            time.sleep(0.0005)
         assert not os.path.exists(sock_path), \
             "Socket file should be cleaned up after shutdown"
 
@@ -1,19 +1,72 @@
 """Tests for WSGI server compliance and environ construction."""
+import functools
+
 import pytest
-from cruet._cruet import parse_http_request
 from cruet.serving import build_environ
 
+from tests.test_server.conftest import parse_cached
+
+
+# build_environ only reads the parsed dict, so the shared parse cache is
+# safe here; wsgi.input is still a fresh stream each build.
+@functools.lru_cache(maxsize=64)
+def _build_cached(raw, client, server):
+    parsed = parse_cached(raw)
+    assert parsed is not None
+    return build_environ(parsed, client, server)
+
+
+_GET_ROOT = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
+_HELLO_WORLD = b"GET /hello/world HTTP/1.1\r\nHost: localhost\r\n\r\n"
+_CUSTOM_HEADERS = (
+    b"GET / HTTP/1.1\r\n"
+    b"Host: localhost\r\n"
+    b"X-Request-Id: abc123\r\n"
+    b"Accept-Language: en-US\r\n"
+    b"\r\n"
+)
+
+# (raw request, environ key, expected value) for single-field checks.
+_ENVIRON_FIELD_CASES = [
+    pytest.param(_HELLO_WORLD, "REQUEST_METHOD", "GET", id="method"),
+    pytest.param(_HELLO_WORLD, "PATH_INFO", "/hello/world", id="path"),
+    pytest.param(b"GET /search?q=test&page=2 HTTP/1.1\r\nHost: localhost\r\n\r\n",
+                 "QUERY_STRING", "q=test&page=2", id="query_string"),
+    pytest.param(b"POST /api HTTP/1.1\r\n"
+                 b"Host: localhost\r\n"
+                 b"Content-Type: application/json\r\n"
+                 b"Content-Length: 2\r\n"
+                 b"\r\n{}",
+                 "CONTENT_TYPE", "application/json", id="content_type"),
+    pytest.param(b"POST /data HTTP/1.1\r\n"
+                 b"Host: localhost\r\n"
+                 b"Content-Length: 5\r\n"
+                 b"\r\nhello",
+                 "CONTENT_LENGTH", "5", id="content_length"),
+    pytest.param(b"GET / HTTP/1.1\r\nHost: example.com:8080\r\n\r\n",
+                 "HTTP_HOST", "example.com:8080", id="http_host"),
+    pytest.param(_CUSTOM_HEADERS, "HTTP_X_REQUEST_ID", "abc123",
+                 id="custom_header"),
+    pytest.param(_CUSTOM_HEADERS, "HTTP_ACCEPT_LANGUAGE", "en-US",
+                 id="custom_header_dashed"),
+    pytest.param(b"HEAD / HTTP/1.1\r\nHost: localhost\r\n\r\n",
+                 "REQUEST_METHOD", "HEAD", id="head_request"),
+]
+
 
 class TestBuildEnviron:
     def _parse_and_build(self, raw, client=("127.0.0.1", 9999),
                          server=("127.0.0.1", 8000)):
-        parsed = parse_http_request(raw)
-        assert parsed is not None
-        return build_environ(parsed, client, server)
+        if b"Content-Length" in raw:
+            # wsgi.input is a stream that tests read, so never share it.
+            parsed = parse_cached(raw)
+            assert parsed is not None
+            return build_environ(parsed, client, server)
+        # Bodyless environs are shared; copy so a test can't leak changes.
+        return dict(_build_cached(raw, client, server))
 
     def test_required_wsgi_keys(self):
-        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        env = self._parse_and_build(raw)
+        env = self._parse_and_build(_GET_ROOT)
         # PEP 3333 required keys
         assert env["REQUEST_METHOD"] == "GET"
         assert "PATH_INFO" in env
@@ -29,59 +82,13 @@ class TestBuildEnviron:
         assert "wsgi.multiprocess" in env
         assert "wsgi.run_once" in env
 
-    def test_method_and_path(self):
-        raw = b"GET /hello/world HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        env = self._parse_and_build(raw)
-        assert env["REQUEST_METHOD"] == "GET"
-        assert env["PATH_INFO"] == "/hello/world"
-
-    def test_query_string(self):
-        raw = b"GET /search?q=test&page=2 HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        env = self._parse_and_build(raw)
-        assert env["QUERY_STRING"] == "q=test&page=2"
-
-    def test_content_type(self):
-        raw = (
-            b"POST /api HTTP/1.1\r\n"
-            b"Host: localhost\r\n"
-            b"Content-Type: application/json\r\n"
-            b"Content-Length: 2\r\n"
-            b"\r\n{}"
-        )
+    @pytest.mark.parametrize("raw,key,expected", _ENVIRON_FIELD_CASES)
+    def test_env_field(self, raw, key, expected):
         env = self._parse_and_build(raw)
-        assert env["CONTENT_TYPE"] == "application/json"
-
-    def test_content_length(self):
-        body = b"hello"
-        raw = (
-            b"POST /data HTTP/1.1\r\n"
-            b"Host: localhost\r\n"
-            b"Content-Length: 5\r\n"
-            b"\r\n" + body
-        )
-        env = self._parse_and_build(raw)
-        assert env["CONTENT_LENGTH"] == "5"
-
-    def test_http_host(self):
-        raw = b"GET / HTTP/1.1\r\nHost: example.com:8080\r\n\r\n"
-        env = self._parse_and_build(raw)
-        assert env["HTTP_HOST"] == "example.com:8080"
-
-    def test_custom_headers(self):
-        raw = (
-            b"GET / HTTP/1.1\r\n"
-            b"Host: localhost\r\n"
-            b"X-Request-Id: abc123\r\n"
-            b"Accept-Language: en-US\r\n"
-            b"\r\n"
-        )
-        env = self._parse_and_build(raw)
-        assert env["HTTP_X_REQUEST_ID"] == "abc123"
-        assert env["HTTP_ACCEPT_LANGUAGE"] == "en-US"
+        assert env[key] == expected
 
     def test_server_info(self):
-        raw = b"GET / HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        env = self._parse_and_build(raw, server=("0.0.0.0", 9000))
+        env = self._parse_and_build(_GET_ROOT, server=("0.0.0.0", 9000))
         assert env["SERVER_NAME"] == "0.0.0.0"
         assert env["SERVER_PORT"] == "9000"
 
@@ -102,15 +109,10 @@ class TestBuildEnviron:
             b"POST /api HTTP/1.1\r\n"
             b"Host: localhost\r\n"
             b"Content-Type: application/json\r\n"
-            b"Content-Length: " + str(len(body)).encode() + b"\r\n"
-            b"\r\n" + body
-        )
+            b"Content-Length: %d\r\n"
+            b"\r\n%s"
+        ) % (len(body), body)
         env = self._parse_and_build(raw)
         assert env["REQUEST_METHOD"] == "POST"
         data = env["wsgi.input"].read()
         assert data == body
-
-    def test_head_request(self):
-        raw = b"HEAD / HTTP/1.1\r\nHost: localhost\r\n\r\n"
-        env = self._parse_and_build(raw)
-        assert env["REQUEST_METHOD"] == "HEAD"